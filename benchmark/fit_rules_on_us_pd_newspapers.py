@@ -26,6 +26,7 @@ SRC_ROOT = REPO_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
+from slop_guard.document import AnalysisDocument  # noqa: E402
 from slop_guard.rules import build_default_rules  # noqa: E402
 
 
@@ -253,6 +254,14 @@ def main() -> None:
     if not corpus:
         raise RuntimeError("No string samples available for fit().")
 
+    started = time.perf_counter()
+    documents = [AnalysisDocument.from_text(sample) for sample in corpus]
+    print(
+        f"Built {len(documents):,} analysis documents in "
+        f"{time.perf_counter() - started:.4f}s.",
+        flush=True,
+    )
+
     rules = build_default_rules()
     print(f"Fitting {len(rules)} rules...", flush=True)
 
@@ -262,7 +271,7 @@ def main() -> None:
         print(f"[{index}/{len(rules)}] {rule_label}", flush=True)
         before = rule.to_dict()
         started = time.perf_counter()
-        rule.fit(corpus)
+        rule.fit_documents(documents)
         fit_elapsed_s = time.perf_counter() - started
         print(f"  - fit_time_s: {fit_elapsed_s:.4f}", flush=True)
         after = rule.to_dict()
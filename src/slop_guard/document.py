@@ -12,6 +12,7 @@ _BOLD_TERM_BULLET_LINE_RE = re.compile(r"^\s*[-*]\s+\*\*|^\s*\d+[.)]\s+\*\*")
 _MARKDOWN_TABLE_DELIMITER_CELL_RE = re.compile(r"^\s*:?-{3,}:?\s*$")
 _WORD_TOKEN_RE = re.compile(r"\w+")
 _EDGE_WORD_STRIP_RE = re.compile(r"^[^\w]+|[^\w]+$")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
 
 
 def word_count(text: str) -> int:
@@ -115,6 +116,20 @@ class AnalysisDocument:
         """Return cached word counts aligned with ``sentences``."""
         return tuple(len(sentence.split()) for sentence in self.sentences)
 
+    @cached_property
+    def em_dash_count(self) -> int:
+        """Return cached count of unicode em dashes and spaced ``--`` dashes."""
+        return self.text.count("\u2014") + self.text.count(" -- ")
+
+    @cached_property
+    def paragraph_word_counts(self) -> tuple[int, ...]:
+        """Return cached word counts for blank-line-delimited paragraphs."""
+        return tuple(
+            len(paragraph.split())
+            for paragraph in _PARAGRAPH_SPLIT_RE.split(self.text)
+            if paragraph.strip()
+        )
+
     @cached_property
     def sentence_analysis_text(self) -> str:
         """Return sentence-analysis text with Markdown blocks replaced."""
@@ -157,19 +172,6 @@ class AnalysisDocument:
         )
         return tuple(token for token in stripped_tokens if token)
 
-    @cached_property
-    def ngram_token_ids_and_base(self) -> tuple[tuple[int, ...], int]:
-        """Return cached n-gram token ids and packing base."""
-        token_to_id: dict[str, int] = {}
-        ids: list[int] = []
-        for token in self.ngram_tokens_lower:
-            token_id = token_to_id.get(token)
-            if token_id is None:
-                token_id = len(token_to_id) + 1
-                token_to_id[token] = token_id
-            ids.append(token_id)
-        return tuple(ids), len(token_to_id) + 1
-
     @cached_property
     def non_empty_lines(self) -> tuple[str, ...]:
         """Return cached lines containing non-whitespace characters."""
@@ -42,7 +42,7 @@ class SourceAnalysisPayload(AnalysisPayload):
     source: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Violation:
     """Canonical violation record emitted by a rule."""
 
@@ -72,7 +72,7 @@ class Violation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     """Output payload emitted by a single rule invocation."""
 
@@ -98,13 +98,33 @@ class AnalysisState:
 
     def merge(self, result: RuleResult) -> "AnalysisState":
         """Merge one rule result into a new state instance."""
+        return self.merge_all((result,))
+
+    def merge_all(self, results: Iterable[RuleResult]) -> "AnalysisState":
+        """Merge rule results in order into a single new state instance.
+
+        Violations and advice are appended to lists and frozen once at the
+        end, so merging many results costs linear rather than quadratic time
+        in the number of accumulated findings.
+
+        Args:
+            results: Rule results to merge, in rule order.
+
+        Returns:
+            A new state holding this state's output followed by ``results``.
+        """
+        violations = list(self.violations)
+        advice = list(self.advice)
         merged_counts = dict(self.counts)
-        for key, delta in result.count_deltas.items():
-            if delta:
-                merged_counts[key] = merged_counts.get(key, 0) + delta
+        for result in results:
+            violations.extend(result.violations)
+            advice.extend(result.advice)
+            for key, delta in result.count_deltas.items():
+                if delta:
+                    merged_counts[key] = merged_counts.get(key, 0) + delta
 
         return AnalysisState(
-            violations=self.violations + tuple(result.violations),
-            advice=self.advice + tuple(result.advice),
+            violations=tuple(violations),
+            advice=tuple(advice),
             counts=merged_counts,
         )
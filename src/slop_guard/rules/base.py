@@ -21,7 +21,7 @@ class RuleLevel(StrEnum):
     PASSAGE = "passage"
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleConfig:
     """Base config container inherited by concrete rule configs."""
 
@@ -37,11 +37,29 @@ class RuleConfig:
         return cls(**dict(raw))
 
 
+FitSampleT = TypeVar("FitSampleT", str, AnalysisDocument)
 ConfigT = TypeVar("ConfigT", bound=RuleConfig)
 ConfigFromDictT = TypeVar("ConfigFromDictT", bound=RuleConfig)
 RuleFromDictT = TypeVar("RuleFromDictT", bound="Rule[Any]")
 
 
+def validate_fit_labels(sample_count: int, labels: list[Label] | None) -> None:
+    """Validate that optional fit labels are integers aligned with the samples."""
+    if labels is None:
+        return
+    if sample_count != len(labels):
+        raise ValueError("samples and labels must have the same length")
+    if not all(isinstance(label, int) for label in labels):
+        raise TypeError("labels must be a list of integers")
+
+
+def validate_fit_inputs(samples: list[str], labels: list[Label] | None) -> None:
+    """Validate shape and types for fit inputs."""
+    if not all(isinstance(sample, str) for sample in samples):
+        raise TypeError("samples must be a list of strings")
+    validate_fit_labels(len(samples), labels)
+
+
 class Rule(ABC, Generic[ConfigT]):
     """Base rule class exposing a forward pass and optional fit step."""
 
@@ -102,6 +120,10 @@ class Rule(ABC, Generic[ConfigT]):
     ) -> "Rule[ConfigT]":
         """Fit rule configuration from labeled samples, scikit-style.
 
+        Samples are validated first. Rules that override ``_fit_documents``
+        receive one parsed ``AnalysisDocument`` per sample; raw-text rules get
+        the samples unchanged through ``_fit``, so they never pay for parsing.
+
         Args:
             samples: Raw text samples used for fitting.
             labels: Integer targets where positive and negative classes map to
@@ -111,36 +133,60 @@ class Rule(ABC, Generic[ConfigT]):
         Returns:
             The same rule instance after updating ``self.config``.
         """
-        self._validate_fit_inputs(samples, labels)
-        self.config = self._fit(samples, labels)
+        validate_fit_inputs(samples, labels)
+        if type(self)._fit_documents is Rule._fit_documents:
+            self.config = self._fit(samples, labels)
+            return self
+        documents = [AnalysisDocument.from_text(sample) for sample in samples]
+        self.config = self._fit_documents(documents, labels)
         return self
 
+    def fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None = None
+    ) -> "Rule[ConfigT]":
+        """Fit rule configuration from prebuilt analysis documents.
+
+        Pipelines build one ``AnalysisDocument`` per sample and share it across
+        every rule, so tokenization and splitting run once per corpus instead of
+        once per rule.
+
+        Args:
+            documents: Analysis documents built from the raw fit samples.
+            labels: Integer targets aligned with ``documents``. Optional for
+                unsupervised fitting.
+
+        Returns:
+            The same rule instance after updating ``self.config``.
+        """
+        validate_fit_labels(len(documents), labels)
+        self.config = self._fit_documents(documents, labels)
+        return self
+
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
+    ) -> ConfigT:
+        """Learn and return a fitted config from prebuilt documents.
+
+        The default implementation defers to ``_fit`` on the raw document text.
+        Rules whose fit pass reads document projections override this hook.
+        """
+        return self._fit([document.text for document in documents], labels)
+
     def _fit(self, samples: list[str], labels: list[Label] | None) -> ConfigT:
-        """Learn and return a fitted config.
+        """Learn and return a fitted config from raw sample text.
 
-        The default implementation is a no-op so existing hard-coded
-        hyperparameters stay active until per-rule fitting is implemented.
+        Rules that only scan raw strings override this hook; rules that read
+        document projections override ``_fit_documents`` instead. The default
+        implementation is a no-op so existing hard-coded hyperparameters stay
+        active until per-rule fitting is implemented.
         """
         _ = samples
         _ = labels
         return self.config
 
-    def _validate_fit_inputs(
-        self, samples: list[str], labels: list[Label] | None
-    ) -> None:
-        """Validate shape and types for fit inputs."""
-        if not all(isinstance(sample, str) for sample in samples):
-            raise TypeError("samples must be a list of strings")
-        if labels is None:
-            return
-        if len(samples) != len(labels):
-            raise ValueError("samples and labels must have the same length")
-        if not all(isinstance(label, int) for label in labels):
-            raise TypeError("labels must be a list of integers")
-
     def _select_fit_samples(
-        self, samples: list[str], labels: list[Label] | None
-    ) -> list[str]:
+        self, samples: list[FitSampleT], labels: list[Label] | None
+    ) -> list[FitSampleT]:
         """Select the corpus used for fitting.
 
         If labels are provided and contain positive examples (``label > 0``),
@@ -150,8 +196,8 @@ class Rule(ABC, Generic[ConfigT]):
         return positive_samples
 
     def _split_fit_samples(
-        self, samples: list[str], labels: list[Label] | None
-    ) -> tuple[list[str], list[str]]:
+        self, samples: list[FitSampleT], labels: list[Label] | None
+    ) -> tuple[list[FitSampleT], list[FitSampleT]]:
         """Split fit samples into positive and negative cohorts.
 
         Positive labels are ``label > 0`` and negative labels are ``label <= 0``.
@@ -161,8 +207,8 @@ class Rule(ABC, Generic[ConfigT]):
         if labels is None:
             return list(samples), []
 
-        positive_samples: list[str] = []
-        negative_samples: list[str] = []
+        positive_samples: list[FitSampleT] = []
+        negative_samples: list[FitSampleT] = []
         for sample, label in zip(samples, labels):
             if label > 0:
                 positive_samples.append(sample)
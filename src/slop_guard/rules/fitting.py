@@ -1,10 +1,13 @@
 """Numeric fitting helpers shared by slop-guard rules."""
 
 import math
+from collections.abc import Sequence
 from typing import TypeAlias
 
 NumericSeq: TypeAlias = list[int] | list[float]
 
+_CANDIDATE_QUANTILES = tuple(index / 20.0 for index in range(21))
+
 
 def clamp_int(value: int, lower: int, upper: int) -> int:
     """Clamp an integer into ``[lower, upper]``."""
@@ -28,13 +31,14 @@ def clamp_float(value: float, lower: float, upper: float) -> float:
     return value
 
 
-def percentile(values: NumericSeq, quantile: float) -> float:
-    """Return linear-interpolated percentile for ``quantile`` in ``[0, 1]``."""
-    if not values:
-        raise ValueError("values must be non-empty")
+def _validate_quantile(quantile: float) -> None:
+    """Raise when ``quantile`` falls outside ``[0, 1]``."""
     if quantile < 0.0 or quantile > 1.0:
         raise ValueError("quantile must be in [0, 1]")
-    ordered = sorted(float(value) for value in values)
+
+
+def _interpolate_sorted(ordered: list[float], quantile: float) -> float:
+    """Return the linear-interpolated percentile of pre-sorted ``ordered``."""
     if len(ordered) == 1:
         return ordered[0]
     position = quantile * (len(ordered) - 1)
@@ -46,6 +50,35 @@ def percentile(values: NumericSeq, quantile: float) -> float:
     return lower_value + ((upper_value - lower_value) * fraction)
 
 
+def percentile(values: NumericSeq, quantile: float) -> float:
+    """Return linear-interpolated percentile for ``quantile`` in ``[0, 1]``."""
+    if not values:
+        raise ValueError("values must be non-empty")
+    _validate_quantile(quantile)
+    return _interpolate_sorted(sorted(float(value) for value in values), quantile)
+
+
+def percentiles(values: NumericSeq, quantiles: Sequence[float]) -> tuple[float, ...]:
+    """Return ``percentile(values, q)`` for every ``q`` from a single sort.
+
+    Args:
+        values: Non-empty numeric sample.
+        quantiles: Quantiles in ``[0, 1]``.
+
+    Returns:
+        Percentiles aligned with ``quantiles``.
+
+    Raises:
+        ValueError: If ``values`` is empty or any quantile is out of range.
+    """
+    if not values:
+        raise ValueError("values must be non-empty")
+    for quantile in quantiles:
+        _validate_quantile(quantile)
+    ordered = sorted(float(value) for value in values)
+    return tuple(_interpolate_sorted(ordered, quantile) for quantile in quantiles)
+
+
 def percentile_ceil(values: NumericSeq, quantile: float) -> int:
     """Return ``ceil(percentile(values, quantile))``."""
     return int(math.ceil(percentile(values, quantile)))
@@ -56,6 +89,27 @@ def percentile_floor(values: NumericSeq, quantile: float) -> int:
     return int(math.floor(percentile(values, quantile)))
 
 
+def length_cv(lengths: Sequence[int]) -> float:
+    """Return the population coefficient of variation of integer lengths.
+
+    Integer lengths give exact sums of ``x`` and ``x * x``, so
+    ``std / mean == sqrt(n * sum_sq - total**2) / total`` with no
+    floating-point cancellation and a single reduction per sum.
+
+    Args:
+        lengths: Non-empty word counts, such as sentence or paragraph lengths.
+
+    Returns:
+        ``std / mean`` of ``lengths``, or ``math.inf`` when the mean is zero so
+        callers comparing against a lower threshold never fire.
+    """
+    total = sum(lengths)
+    if total <= 0:
+        return math.inf
+    sum_sq = sum([length * length for length in lengths])
+    return math.sqrt(len(lengths) * sum_sq - total * total) / total
+
+
 def fit_penalty(base_penalty: int, matched_documents: int, total_documents: int) -> int:
     """Scale penalty magnitude by document support in the fit corpus."""
     if total_documents <= 0:
@@ -126,9 +180,8 @@ def _threshold_candidates(
         candidates.add(clamp_float(combined[0], lower, upper))
         return sorted(candidates)
 
-    for index in range(21):
-        quantile = index / 20.0
-        candidates.add(clamp_float(percentile(combined, quantile), lower, upper))
+    for value in percentiles(combined, _CANDIDATE_QUANTILES):
+        candidates.add(clamp_float(value, lower, upper))
     return sorted(candidates)
 
 
@@ -187,19 +240,13 @@ def fit_threshold_high_contrastive(
         upper=upper,
     )
     candidates.extend(
-        (
-            clamp_float(percentile(positive_values, positive_quantile), lower, upper),
-            clamp_float(percentile(positive_values, 0.99), lower, upper),
-        )
+        clamp_float(value, lower, upper)
+        for value in percentiles(positive_values, (positive_quantile, 0.99))
     )
     if negative_values:
         candidates.extend(
-            (
-                clamp_float(
-                    percentile(negative_values, negative_quantile), lower, upper
-                ),
-                clamp_float(percentile(negative_values, 0.01), lower, upper),
-            )
+            clamp_float(value, lower, upper)
+            for value in percentiles(negative_values, (negative_quantile, 0.01))
         )
     candidates = sorted(set(candidates))
 
@@ -266,19 +313,13 @@ def fit_threshold_low_contrastive(
         upper=upper,
     )
     candidates.extend(
-        (
-            clamp_float(percentile(positive_values, positive_quantile), lower, upper),
-            clamp_float(percentile(positive_values, 0.01), lower, upper),
-        )
+        clamp_float(value, lower, upper)
+        for value in percentiles(positive_values, (positive_quantile, 0.01))
     )
     if negative_values:
         candidates.extend(
-            (
-                clamp_float(
-                    percentile(negative_values, negative_quantile), lower, upper
-                ),
-                clamp_float(percentile(negative_values, 0.99), lower, upper),
-            )
+            clamp_float(value, lower, upper)
+            for value in percentiles(negative_values, (negative_quantile, 0.99))
         )
     candidates = sorted(set(candidates))
 
@@ -341,11 +382,8 @@ def fit_count_cap_contrastive(
     if len(combined) == 1:
         candidates.add(clamp_int(int(round(combined[0])), lower, upper))
     elif combined:
-        for index in range(21):
-            quantile = index / 20.0
-            candidates.add(
-                clamp_int(int(round(percentile(combined, quantile))), lower, upper)
-            )
+        for value in percentiles(combined, _CANDIDATE_QUANTILES):
+            candidates.add(clamp_int(int(round(value)), lower, upper))
     candidates.add(
         clamp_int(percentile_ceil(positive_values, positive_quantile), lower, upper)
     )
@@ -1,12 +1,14 @@
 """N-gram helpers shared by slop-guard rules."""
 
 import re
+from bisect import bisect_right
+from collections import Counter
 from typing import TypeAlias
 
 from slop_guard.config import Hyperparameters
 
 NGram: TypeAlias = tuple[str, ...]
-NGramHit: TypeAlias = dict[str, int | str]
+NGramHit: TypeAlias = tuple[str, int, int]
 TokenSeq: TypeAlias = NGram | list[str]
 
 _PUNCT_STRIP_RE = re.compile(r"^[^\w]+|[^\w]+$")
@@ -104,114 +106,79 @@ def normalize_ngram_tokens(text: str) -> list[str]:
     ]
 
 
-def has_repeated_ngram_prefix(
-    *,
-    token_ids: tuple[int, ...],
-    base: int,
-    n: int,
-    min_count: int,
-) -> bool:
-    """Return true when any n-gram id sequence appears at least ``min_count`` times."""
-    if n < 1:
-        raise ValueError("n must be >= 1")
-    if min_count < 2:
-        return len(token_ids) >= n
-    if len(token_ids) < n:
-        return False
-
-    end = len(token_ids) - n + 1
-    counts: dict[int, int] = {}
-    counts_get = counts.get
-    if n == 1:
-        for start in range(end):
-            key = token_ids[start]
-            next_count = counts_get(key, 0) + 1
-            if next_count >= min_count:
-                return True
-            counts[key] = next_count
-        return False
-    if n == 2:
-        for start in range(end):
-            key = (token_ids[start] * base) + token_ids[start + 1]
-            next_count = counts_get(key, 0) + 1
-            if next_count >= min_count:
-                return True
-            counts[key] = next_count
-        return False
-    if n == 3:
-        base_squared = base * base
-        for start in range(end):
-            key = (
-                (token_ids[start] * base_squared)
-                + (token_ids[start + 1] * base)
-                + token_ids[start + 2]
-            )
-            next_count = counts_get(key, 0) + 1
-            if next_count >= min_count:
-                return True
-            counts[key] = next_count
-        return False
-    for start in range(end):
-        key = 0
-        for offset in range(n):
-            key = (key * base) + token_ids[start + offset]
-        next_count = counts_get(key, 0) + 1
-        if next_count >= min_count:
-            return True
-        counts[key] = next_count
-    return False
-
-
 def find_repeated_ngrams_from_tokens(
     tokens: TokenSeq,
     hyperparameters: Hyperparameters,
 ) -> list[NGramHit]:
-    """Find repeated multi-word phrases and keep only maximal spans."""
+    """Find repeated multi-word phrases and keep only maximal spans.
+
+    Hits are ``(phrase, count, n)`` tuples ordered longest first, then by
+    descending count.
+    """
     min_n = hyperparameters.repeated_ngram_min_n
     max_n = hyperparameters.repeated_ngram_max_n
     if len(tokens) < min_n:
         return []
 
+    # zip() over offset slices yields every n-gram window as a tuple and
+    # Counter tallies them, so each length is counted in one C-level pass.
+    # Every occurrence of an (n + 1)-gram contains one of its n-gram prefix,
+    # so once no n-gram reaches the threshold no longer length can either.
+    # The min_n level doubles as the cheap reject gate for documents without
+    # any repeated phrase.
+    min_count = hyperparameters.repeated_ngram_min_count
     ngram_counts: dict[NGram, int] = {}
     for n in range(min_n, max_n + 1):
-        end = len(tokens) - n + 1
-        for index in range(end):
-            gram: NGram = tuple(tokens[index : index + n])
-            ngram_counts[gram] = ngram_counts.get(gram, 0) + 1
+        level_counts = Counter(zip(*(tokens[offset:] for offset in range(n))))
+        if not level_counts or max(level_counts.values()) < min_count:
+            break
+        ngram_counts.update(level_counts)
 
     repeated: dict[NGram, int] = {
         gram: count
         for gram, count in ngram_counts.items()
-        if count >= hyperparameters.repeated_ngram_min_count
-        and not all(word in _STOPWORDS for word in gram)
+        if count >= min_count and not all(word in _STOPWORDS for word in gram)
     }
     if not repeated:
         return []
 
-    to_remove: set[NGram] = set()
     sorted_grams: list[NGram] = sorted(
         repeated, key=lambda gram: len(gram), reverse=True
     )
-    for index, longer in enumerate(sorted_grams):
-        longer_str = " ".join(longer)
-        for shorter in sorted_grams[index + 1 :]:
-            if shorter in to_remove:
-                continue
-            shorter_str = " ".join(shorter)
-            if shorter_str in longer_str and repeated[longer] >= repeated[shorter]:
-                to_remove.add(shorter)
+    phrases = [" ".join(gram) for gram in sorted_grams]
+    counts = [repeated[gram] for gram in sorted_grams]
+
+    # A gram is subsumed when its phrase occurs inside an earlier (longer or
+    # equal-length) phrase whose count is at least as high. Joining every phrase
+    # into one newline-separated haystack turns the pairwise check into C-level
+    # ``str.find`` scans bounded to the phrases that precede each gram; tokens
+    # never contain whitespace, so matches cannot straddle two phrases.
+    starts: list[int] = []
+    offset = 0
+    for phrase in phrases:
+        starts.append(offset)
+        offset += len(phrase) + 1
+    haystack = "\n".join(phrases)
 
+    to_remove: set[NGram] = set()
+    for index in range(1, len(phrases)):
+        phrase = phrases[index]
+        count = counts[index]
+        end = starts[index]
+        hit = haystack.find(phrase, 0, end)
+        while hit >= 0:
+            owner = bisect_right(starts, hit) - 1
+            if counts[owner] >= count:
+                to_remove.add(sorted_grams[index])
+                break
+            hit = haystack.find(phrase, starts[owner + 1], end)
+
+    phrase_by_gram = dict(zip(sorted_grams, phrases))
     results: list[NGramHit] = []
     for gram in sorted(repeated.keys(), key=lambda item: (-len(item), -repeated[item])):
         if gram in to_remove:
             continue
-        results.append(
-            {
-                "phrase": " ".join(gram),
-                "count": repeated[gram],
-                "n": len(gram),
-            }
-        )
+        results.append((phrase_by_gram[gram], repeated[gram], len(gram)))
     return results
 
 
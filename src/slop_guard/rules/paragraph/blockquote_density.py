@@ -34,7 +34,7 @@ from slop_guard.rules.fitting import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockquoteDensityRuleConfig(RuleConfig):
     """Config for blockquote overuse detection."""
 
@@ -131,17 +131,18 @@ class BlockquoteDensityRule(Rule[BlockquoteDensityRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> BlockquoteDensityRuleConfig:
         """Fit blockquote density thresholds from corpus line counts."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_counts: list[int] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in positive_documents:
             in_code_block = False
             blockquote_count = 0
             for line, is_blockquote in zip(document.lines, document.line_is_blockquote):
@@ -153,8 +154,7 @@ class BlockquoteDensityRule(Rule[BlockquoteDensityRuleConfig]):
             positive_counts.append(blockquote_count)
 
         negative_counts: list[int] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in negative_documents:
             in_code_block = False
             blockquote_count = 0
             for line, is_blockquote in zip(document.lines, document.line_is_blockquote):
@@ -32,7 +32,7 @@ from slop_guard.rules.fitting import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoldTermBulletRunRuleConfig(RuleConfig):
     """Config for bold-term bullet run thresholds."""
 
@@ -124,18 +124,19 @@ class BoldTermBulletRunRule(Rule[BoldTermBulletRunRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> BoldTermBulletRunRuleConfig:
         """Fit run length threshold from observed bold bullet runs."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_run_lengths: list[int] = []
         positive_matched_documents = 0
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in positive_documents:
             run = 0
             has_run = False
             for is_bold_term_bullet in (*document.line_is_bold_term_bullet, False):
@@ -151,8 +152,7 @@ class BoldTermBulletRunRule(Rule[BoldTermBulletRunRuleConfig]):
 
         negative_run_lengths: list[int] = []
         negative_matched_documents = 0
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in negative_documents:
             run = 0
             has_run = False
             for is_bold_term_bullet in (*document.line_is_bold_term_bullet, False):
@@ -194,8 +194,8 @@ class BoldTermBulletRunRule(Rule[BoldTermBulletRunRuleConfig]):
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matched_documents,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matched_documents,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
@@ -29,7 +29,7 @@ from slop_guard.rules.fitting import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletDensityRuleConfig(RuleConfig):
     """Config for bullet density thresholds."""
 
@@ -102,17 +102,18 @@ class BulletDensityRule(Rule[BulletDensityRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> BulletDensityRuleConfig:
         """Fit bullet-density threshold from corpus line ratios."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_ratios: list[float] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in positive_documents:
             total_non_empty = len(document.non_empty_lines)
             if total_non_empty <= 0:
                 continue
@@ -122,8 +123,7 @@ class BulletDensityRule(Rule[BulletDensityRuleConfig]):
             return self.config
 
         negative_ratios: list[float] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in negative_documents:
             total_non_empty = len(document.non_empty_lines)
             if total_non_empty <= 0:
                 continue
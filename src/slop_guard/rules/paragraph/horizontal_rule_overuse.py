@@ -33,7 +33,7 @@ from slop_guard.rules.fitting import (
 _HORIZONTAL_RULE_RE = re.compile(r"^\s*(?:---+|\*\*\*+|___+)\s*$", re.MULTILINE)
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalRuleOveruseRuleConfig(RuleConfig):
     """Config for horizontal rule overuse thresholds."""
 
@@ -50,7 +50,7 @@ def _triadic_advice(snippet: str) -> str:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralPatternRuleConfig(RuleConfig):
     """Config for listicle-like structural pattern thresholds."""
 
@@ -230,12 +230,14 @@ class StructuralPatternRule(Rule[StructuralPatternRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> StructuralPatternRuleConfig:
         """Fit structural thresholds from corpus formatting patterns."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_bold_header_counts: list[int] = []
@@ -245,15 +247,13 @@ class StructuralPatternRule(Rule[StructuralPatternRuleConfig]):
         positive_triadic_documents = 0
         positive_bullet_run_documents = 0
 
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
-
-            bold_count = len(_BOLD_HEADER_RE.findall(sample))
+        for document in positive_documents:
+            bold_count = len(_BOLD_HEADER_RE.findall(document.text))
             positive_bold_header_counts.append(bold_count)
             if bold_count > 0:
                 positive_bold_documents += 1
 
-            triadic_count = len(_TRIADIC_RE.findall(sample))
+            triadic_count = len(_TRIADIC_RE.findall(document.text))
             positive_triadic_counts.append(triadic_count)
             if triadic_count > 0:
                 positive_triadic_documents += 1
@@ -277,15 +277,13 @@ class StructuralPatternRule(Rule[StructuralPatternRuleConfig]):
         negative_bold_documents = 0
         negative_triadic_documents = 0
         negative_bullet_run_documents = 0
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
-
-            bold_count = len(_BOLD_HEADER_RE.findall(sample))
+        for document in negative_documents:
+            bold_count = len(_BOLD_HEADER_RE.findall(document.text))
             negative_bold_header_counts.append(bold_count)
             if bold_count > 0:
                 negative_bold_documents += 1
 
-            triadic_count = len(_TRIADIC_RE.findall(sample))
+            triadic_count = len(_TRIADIC_RE.findall(document.text))
             negative_triadic_counts.append(triadic_count)
             if triadic_count > 0:
                 negative_triadic_documents += 1
@@ -368,25 +366,25 @@ class StructuralPatternRule(Rule[StructuralPatternRuleConfig]):
             bold_header_penalty=fit_penalty_contrastive(
                 base_penalty=self.config.bold_header_penalty,
                 positive_matches=positive_bold_documents,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_bold_documents,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             bullet_run_min=bullet_run_min,
             bullet_run_penalty=fit_penalty_contrastive(
                 base_penalty=self.config.bullet_run_penalty,
                 positive_matches=positive_bullet_run_documents,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_bullet_run_documents,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             triadic_record_cap=triadic_record_cap,
             triadic_penalty=fit_penalty_contrastive(
                 base_penalty=self.config.triadic_penalty,
                 positive_matches=positive_triadic_documents,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_triadic_documents,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             triadic_advice_min=triadic_advice_min,
             context_window_chars=self.config.context_window_chars,
@@ -52,7 +52,7 @@ _CLOSING_APHORISM_PATTERNS: tuple[re.Pattern[str], ...] = (
 _MIN_PATTERN_MATCHES = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosingAphorismRuleConfig(RuleConfig):
     """Config for closing aphorism detection."""
 
@@ -132,16 +132,17 @@ class ClosingAphorismRule(Rule[ClosingAphorismRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ClosingAphorismRuleConfig:
         """Fit penalty from closing-aphorism prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        def has_aphorism(sample: str) -> bool:
-            doc = AnalysisDocument.from_text(sample)
+        def has_aphorism(doc: AnalysisDocument) -> bool:
             if len(doc.sentences) < self.config.min_sentences:
                 return False
             last = doc.sentences[-1]
@@ -150,15 +151,15 @@ class ClosingAphorismRule(Rule[ClosingAphorismRuleConfig]):
                 >= _MIN_PATTERN_MATCHES
             )
 
-        positive_matches = sum(1 for s in positive_samples if has_aphorism(s))
-        negative_matches = sum(1 for s in negative_samples if has_aphorism(s))
+        positive_matches = sum(1 for d in positive_documents if has_aphorism(d))
+        negative_matches = sum(1 for d in negative_documents if has_aphorism(d))
         return ClosingAphorismRuleConfig(
             min_sentences=self.config.min_sentences,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
@@ -34,7 +34,7 @@ _MD_HEADER_LINE_RE = re.compile(r"^\s*#", re.MULTILINE)
 _JSON_COLON_RE = re.compile(r': ["{\[\d]|: true|: false|: null')
 
 
-@dataclass
+@dataclass(slots=True)
 class ColonDensityRuleConfig(RuleConfig):
     """Config for elaboration-colon density checks."""
 
@@ -133,17 +133,18 @@ class ColonDensityRule(Rule[ColonDensityRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ColonDensityRuleConfig:
         """Fit colon density threshold from corpus elaboration ratios."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_ratios: list[float] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in positive_documents:
             stripped_text = document.text_without_code_blocks
             stripped_word_count = document.word_count_without_code_blocks
             if stripped_word_count <= 0:
@@ -171,8 +172,7 @@ class ColonDensityRule(Rule[ColonDensityRuleConfig]):
             return self.config
 
         negative_ratios: list[float] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in negative_documents:
             stripped_text = document.text_without_code_blocks
             stripped_word_count = document.word_count_without_code_blocks
             if stripped_word_count <= 0:
@@ -29,7 +29,7 @@ from slop_guard.rules.fitting import fit_penalty_contrastive
 _COPULA_FIRST_WORDS_RE = re.compile(r"\b(is|are|was|were)\b", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True)
 class CopulaChainRuleConfig(RuleConfig):
     """Config for copula-chain density detection."""
 
@@ -118,16 +118,17 @@ class CopulaChainRule(Rule[CopulaChainRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> CopulaChainRuleConfig:
         """Fit penalty from copula-chain prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        def has_chain(sample: str) -> bool:
-            doc = AnalysisDocument.from_text(sample)
+        def has_chain(doc: AnalysisDocument) -> bool:
             if len(doc.sentences) < self.config.min_sentences:
                 return False
             count = sum(
@@ -137,16 +138,16 @@ class CopulaChainRule(Rule[CopulaChainRuleConfig]):
             )
             return count / len(doc.sentences) >= self.config.threshold
 
-        positive_matches = sum(1 for s in positive_samples if has_chain(s))
-        negative_matches = sum(1 for s in negative_samples if has_chain(s))
+        positive_matches = sum(1 for d in positive_documents if has_chain(d))
+        negative_matches = sum(1 for d in negative_documents if has_chain(d))
         return CopulaChainRuleConfig(
             min_sentences=self.config.min_sentences,
             threshold=self.config.threshold,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
@@ -18,7 +18,6 @@ Example Non-Violations:
 Severity: Low to medium; stylistic alone, but meaningful when persistent.
 """
 
-import re
 from dataclasses import dataclass, field
 
 from slop_guard.document import AnalysisDocument
@@ -29,10 +28,8 @@ from slop_guard.rules.fitting import (
     fit_threshold_high_contrastive,
 )
 
-_EM_DASH_RE = re.compile(r"\u2014| -- ")
 
-
-@dataclass
+@dataclass(slots=True)
 class EmDashDensityRuleConfig(RuleConfig):
     """Config for em dash density thresholding."""
 
@@ -85,14 +82,14 @@ class EmDashDensityRule(Rule[EmDashDensityRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Compute em-dash-per-basis ratio and emit one density violation."""
-        if document.word_count <= 0:
+        word_count = document.word_count
+        if word_count <= 0:
             return RuleResult()
 
-        em_dash_count = len(_EM_DASH_RE.findall(document.text))
-        ratio_per_basis = (
-            em_dash_count / document.word_count
-        ) * self.config.words_basis
-        if ratio_per_basis <= self.config.density_threshold:
+        config = self.config
+        em_dash_count = document.em_dash_count
+        ratio_per_basis = (em_dash_count / word_count) * config.words_basis
+        if ratio_per_basis <= config.density_threshold:
             return RuleResult()
 
         return RuleResult(
@@ -101,49 +98,46 @@ class EmDashDensityRule(Rule[EmDashDensityRuleConfig]):
                     rule=self.name,
                     match="em_dash_density",
                     context=(
-                        f"{em_dash_count} em dashes in {document.word_count} words "
+                        f"{em_dash_count} em dashes in {word_count} words "
                         f"({ratio_per_basis:.1f} per 150 words)"
                     ),
-                    penalty=self.config.penalty,
+                    penalty=config.penalty,
                 )
             ],
             advice=[
-                f"Too many em dashes ({em_dash_count} in {document.word_count} words) "
+                f"Too many em dashes ({em_dash_count} in {word_count} words) "
                 "\u2014 use other punctuation."
             ],
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> EmDashDensityRuleConfig:
         """Fit em-dash density threshold from empirical ratios."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
+        words_basis = self.config.words_basis
         positive_ratios: list[float] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
-            if document.word_count <= 0:
+        for document in positive_documents:
+            word_count = document.word_count
+            if word_count <= 0:
                 continue
-            em_dash_count = len(_EM_DASH_RE.findall(sample))
-            positive_ratios.append(
-                (em_dash_count / document.word_count) * self.config.words_basis
-            )
+            positive_ratios.append((document.em_dash_count / word_count) * words_basis)
 
         if not positive_ratios:
             return self.config
 
         negative_ratios: list[float] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
-            if document.word_count <= 0:
+        for document in negative_documents:
+            word_count = document.word_count
+            if word_count <= 0:
                 continue
-            em_dash_count = len(_EM_DASH_RE.findall(sample))
-            negative_ratios.append(
-                (em_dash_count / document.word_count) * self.config.words_basis
-            )
+            negative_ratios.append((document.em_dash_count / word_count) * words_basis)
 
         density_threshold = fit_threshold_high_contrastive(
             default_value=self.config.density_threshold,
@@ -163,7 +157,7 @@ class EmDashDensityRule(Rule[EmDashDensityRuleConfig]):
         )
 
         return EmDashDensityRuleConfig(
-            words_basis=self.config.words_basis,
+            words_basis=words_basis,
             density_threshold=density_threshold,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
@@ -24,7 +24,7 @@ from slop_guard.rules.base import Label, Rule, RuleConfig, RuleLevel
 from slop_guard.rules.fitting import fit_penalty_contrastive
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtremeSentenceRuleConfig(RuleConfig):
     """Config for extreme sentence length detection."""
 
@@ -67,33 +67,33 @@ class ExtremeSentenceRule(Rule[ExtremeSentenceRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Scan all sentences and flag any that exceed min_words."""
+        word_counts = document.sentence_analysis_word_counts
+        min_words = self.config.min_words
+        if max(word_counts, default=0) < min_words:
+            return RuleResult()
+
         violations: list[Violation] = []
         advice: list[str] = []
         count = 0
 
-        for idx, (sentence, wc) in enumerate(
-            zip(
-                document.sentence_analysis_sentences,
-                document.sentence_analysis_word_counts,
-            )
+        for sentence_number, (sentence, wc) in enumerate(
+            zip(document.sentence_analysis_sentences, word_counts), start=1
         ):
-            if wc >= self.config.min_words:
-                preview = (
-                    f'"{sentence[:80]}..."' if len(sentence) > 80 else f'"{sentence}"'
-                )
+            if wc >= min_words:
+                preview = sentence if len(sentence) <= 80 else f"{sentence[:80]}..."
                 violations.append(
                     Violation(
                         rule=self.name,
                         match="run_on_sentence",
                         context=(
-                            f"Sentence {idx + 1} has {wc} words "
-                            f"(>= {self.config.min_words}): {preview}"
+                            f"Sentence {sentence_number} has {wc} words "
+                            f'(>= {min_words}): "{preview}"'
                         ),
                         penalty=self.config.penalty,
                     )
                 )
                 advice.append(
-                    f"Sentence {idx + 1} is {wc} words - break it into "
+                    f"Sentence {sentence_number} is {wc} words - break it into "
                     "shorter sentences."
                 )
                 count += 1
@@ -104,29 +104,30 @@ class ExtremeSentenceRule(Rule[ExtremeSentenceRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ExtremeSentenceRuleConfig:
         """Fit penalty from extreme-sentence prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        def has_extreme(sample: str) -> bool:
-            doc = AnalysisDocument.from_text(sample)
-            return any(
-                wc >= self.config.min_words for wc in doc.sentence_analysis_word_counts
-            )
+        min_words = self.config.min_words
+
+        def has_extreme(document: AnalysisDocument) -> bool:
+            return max(document.sentence_analysis_word_counts, default=0) >= min_words
 
-        positive_matches = sum(1 for s in positive_samples if has_extreme(s))
-        negative_matches = sum(1 for s in negative_samples if has_extreme(s))
+        positive_matches = sum(1 for d in positive_documents if has_extreme(d))
+        negative_matches = sum(1 for d in negative_documents if has_extreme(d))
         return ExtremeSentenceRuleConfig(
-            min_words=self.config.min_words,
+            min_words=min_words,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
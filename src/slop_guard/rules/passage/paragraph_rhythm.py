@@ -21,29 +21,19 @@ Example Non-Violations:
 Severity: Low to medium; stronger when combined with other rhythm signals.
 """
 
-import math
-import re
 from dataclasses import dataclass, field
 
 from slop_guard.document import AnalysisDocument
 from slop_guard.models import RuleResult, Violation
 from slop_guard.rules.base import Label, Rule, RuleConfig, RuleLevel
-from slop_guard.rules.fitting import fit_penalty_contrastive
-
-_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
-
-
-def _paragraph_word_counts(text: str) -> list[int]:
-    """Split text on blank lines and return word counts per paragraph."""
-    return [len(p.split()) for p in _PARAGRAPH_SPLIT_RE.split(text) if p.strip()]
-
+from slop_guard.rules.fitting import fit_penalty_contrastive, length_cv
 
 # ---------------------------------------------------------------------------
 # ParagraphBalanceRule
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphBalanceRuleConfig(RuleConfig):
     """Config for paragraph balance ratio detection."""
 
@@ -99,7 +89,7 @@ class ParagraphBalanceRule(Rule[ParagraphBalanceRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Compute min/max balance ratio across body paragraphs."""
-        lengths = _paragraph_word_counts(document.text)
+        lengths = document.paragraph_word_counts
         # Body paragraphs = everything after the first
         if len(lengths) < self.config.min_body_paragraphs + 1:
             return RuleResult()
@@ -119,7 +109,7 @@ class ParagraphBalanceRule(Rule[ParagraphBalanceRuleConfig]):
                     rule=self.name,
                     match="paragraph_balance",
                     context=(
-                        f"Body paragraph word counts {body} - "
+                        f"Body paragraph word counts {list(body)} - "
                         f"balance ratio {ratio:.2f} "
                         f"(> {self.config.balance_threshold})"
                     ),
@@ -134,33 +124,38 @@ class ParagraphBalanceRule(Rule[ParagraphBalanceRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ParagraphBalanceRuleConfig:
         """Fit penalty from paragraph balance prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        def has_balance(sample: str) -> bool:
-            lengths = _paragraph_word_counts(sample)
-            if len(lengths) < self.config.min_body_paragraphs + 1:
+        min_paragraphs = self.config.min_body_paragraphs + 1
+        balance_threshold = self.config.balance_threshold
+
+        def has_balance(document: AnalysisDocument) -> bool:
+            lengths = document.paragraph_word_counts
+            if len(lengths) < min_paragraphs:
                 return False
             body = lengths[1:]
             max_len = max(body)
-            return max_len > 0 and min(body) / max_len > self.config.balance_threshold
+            return max_len > 0 and min(body) / max_len > balance_threshold
 
-        positive_matches = sum(1 for s in positive_samples if has_balance(s))
-        negative_matches = sum(1 for s in negative_samples if has_balance(s))
+        positive_matches = sum(1 for d in positive_documents if has_balance(d))
+        negative_matches = sum(1 for d in negative_documents if has_balance(d))
         return ParagraphBalanceRuleConfig(
             min_body_paragraphs=self.config.min_body_paragraphs,
             balance_threshold=self.config.balance_threshold,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
 
@@ -170,7 +165,7 @@ class ParagraphBalanceRule(Rule[ParagraphBalanceRuleConfig]):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphCVRuleConfig(RuleConfig):
     """Config for paragraph length coefficient-of-variation detection."""
 
@@ -231,16 +226,11 @@ class ParagraphCVRule(Rule[ParagraphCVRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Compute paragraph-length CV and emit a violation if low."""
-        lengths = _paragraph_word_counts(document.text)
+        lengths = document.paragraph_word_counts
         if len(lengths) < self.config.min_paragraphs:
             return RuleResult()
 
-        mean = sum(lengths) / len(lengths)
-        if mean <= 0:
-            return RuleResult()
-
-        variance = sum((x - mean) ** 2 for x in lengths) / len(lengths)
-        cv = math.sqrt(variance) / mean
+        cv = length_cv(lengths)
         if cv >= self.config.cv_threshold:
             return RuleResult()
 
@@ -252,7 +242,7 @@ class ParagraphCVRule(Rule[ParagraphCVRuleConfig]):
                     context=(
                         f"Paragraph length CV={cv:.2f} "
                         f"(< {self.config.cv_threshold:.2f}) "
-                        f"across lengths {lengths}"
+                        f"across lengths {list(lengths)}"
                     ),
                     penalty=self.config.penalty,
                 )
@@ -264,34 +254,35 @@ class ParagraphCVRule(Rule[ParagraphCVRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ParagraphCVRuleConfig:
         """Fit penalty from paragraph CV prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        def has_low_cv(sample: str) -> bool:
-            lengths = _paragraph_word_counts(sample)
-            if len(lengths) < self.config.min_paragraphs:
-                return False
-            mean = sum(lengths) / len(lengths)
-            if mean <= 0:
+        min_paragraphs = self.config.min_paragraphs
+        cv_threshold = self.config.cv_threshold
+
+        def has_low_cv(document: AnalysisDocument) -> bool:
+            lengths = document.paragraph_word_counts
+            if len(lengths) < min_paragraphs:
                 return False
-            variance = sum((x - mean) ** 2 for x in lengths) / len(lengths)
-            return math.sqrt(variance) / mean < self.config.cv_threshold
+            return length_cv(lengths) < cv_threshold
 
-        positive_matches = sum(1 for s in positive_samples if has_low_cv(s))
-        negative_matches = sum(1 for s in negative_samples if has_low_cv(s))
+        positive_matches = sum(1 for d in positive_documents if has_low_cv(d))
+        negative_matches = sum(1 for d in negative_documents if has_low_cv(d))
         return ParagraphCVRuleConfig(
             min_paragraphs=self.config.min_paragraphs,
             cv_threshold=self.config.cv_threshold,
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
         )
@@ -31,15 +31,45 @@ from slop_guard.rules.fitting import (
     fit_penalty_contrastive,
     fit_threshold_high_contrastive,
     percentile_ceil,
-    percentile_floor,
+    percentiles,
 )
-from slop_guard.rules.ngrams import (
-    find_repeated_ngrams_from_tokens,
-    has_repeated_ngram_prefix,
+from slop_guard.rules.ngrams import find_repeated_ngrams_from_tokens
+
+_FIT_SCAN_HYPERPARAMETERS = Hyperparameters(
+    repeated_ngram_min_n=2,
+    repeated_ngram_max_n=8,
+    repeated_ngram_min_count=2,
 )
 
 
-@dataclass
+def _scan_fit_documents(
+    documents: list[AnalysisDocument],
+) -> tuple[list[int], list[int], list[int]]:
+    """Scan fit documents with the wide fit grid and flatten their hits.
+
+    Args:
+        documents: Analysis documents built from the fit samples.
+
+    Returns:
+        Tuple of per-hit n-gram lengths, per-hit counts, and per-document hit
+        totals, in document order.
+    """
+    n_values: list[int] = []
+    counts: list[int] = []
+    per_document_hits: list[int] = []
+    for document in documents:
+        repeated = find_repeated_ngrams_from_tokens(
+            document.ngram_tokens_lower,
+            _FIT_SCAN_HYPERPARAMETERS,
+        )
+        per_document_hits.append(len(repeated))
+        for _, count, n in repeated:
+            n_values.append(n)
+            counts.append(count)
+    return n_values, counts, per_document_hits
+
+
+@dataclass(slots=True)
 class PhraseReuseRuleConfig(RuleConfig):
     """Config for phrase-reuse detection and recording."""
 
@@ -114,17 +144,6 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
         if len(tokens) < self.config.repeated_ngram_min_n:
             return RuleResult()
 
-        if self.config.repeated_ngram_min_n > 1:
-            token_ids, base = document.ngram_token_ids_and_base
-            has_prefix_repeat = has_repeated_ngram_prefix(
-                token_ids=token_ids,
-                base=base,
-                n=self.config.repeated_ngram_min_n - 1,
-                min_count=self.config.repeated_ngram_min_count,
-            )
-            if not has_prefix_repeat:
-                return RuleResult()
-
         ngram_hyperparameters = Hyperparameters(
             repeated_ngram_min_n=self.config.repeated_ngram_min_n,
             repeated_ngram_max_n=self.config.repeated_ngram_max_n,
@@ -133,29 +152,24 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
         repeated_ngrams = find_repeated_ngrams_from_tokens(
             tokens, ngram_hyperparameters
         )
-        violations: list[Violation] = []
-        advice: list[str] = []
-        count = 0
-
-        for ngram in repeated_ngrams:
-            if count >= self.config.record_cap:
-                break
-
-            phrase = str(ngram["phrase"])
-            n_value = int(ngram["n"])
-            phrase_count = int(ngram["count"])
-            violations.append(
-                Violation(
-                    rule=self.name,
-                    match=phrase,
-                    context=f"'{phrase}' ({n_value}-word phrase) appears {phrase_count} times",
-                    penalty=self.config.penalty,
-                )
-            )
-            advice.append(
-                f"'{phrase}' appears {phrase_count} times \u2014 vary your phrasing to avoid repetition."
+        recorded = repeated_ngrams[: self.config.record_cap]
+        name = self.name
+        penalty = self.config.penalty
+        violations = [
+            Violation(
+                rule=name,
+                match=phrase,
+                context=f"'{phrase}' ({n}-word phrase) appears {phrase_count} times",
+                penalty=penalty,
             )
-            count += 1
+            for phrase, phrase_count, n in recorded
+        ]
+        advice = [
+            f"'{phrase}' appears {phrase_count} times \u2014 vary your phrasing "
+            "to avoid repetition."
+            for phrase, phrase_count, _ in recorded
+        ]
+        count = len(recorded)
 
         return RuleResult(
             violations=violations,
@@ -163,54 +177,37 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> PhraseReuseRuleConfig:
         """Fit n-gram reuse thresholds from observed repeated phrases."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        scan_hp = Hyperparameters(
-            repeated_ngram_min_n=2,
-            repeated_ngram_max_n=8,
-            repeated_ngram_min_count=2,
+        positive_n_values, positive_counts, positive_per_document_hits = (
+            _scan_fit_documents(positive_documents)
         )
-        positive_n_values: list[int] = []
-        positive_counts: list[int] = []
-        positive_per_document_hits: list[int] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
-            repeated = find_repeated_ngrams_from_tokens(
-                document.ngram_tokens_lower, scan_hp
-            )
-            positive_per_document_hits.append(len(repeated))
-            for hit in repeated:
-                positive_n_values.append(int(hit["n"]))
-                positive_counts.append(int(hit["count"]))
-
         if not positive_n_values or not positive_counts:
             return self.config
 
-        negative_n_values: list[int] = []
-        negative_counts: list[int] = []
-        negative_per_document_hits: list[int] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
-            repeated = find_repeated_ngrams_from_tokens(
-                document.ngram_tokens_lower, scan_hp
-            )
-            negative_per_document_hits.append(len(repeated))
-            for hit in repeated:
-                negative_n_values.append(int(hit["n"]))
-                negative_counts.append(int(hit["count"]))
+        negative_n_values, negative_counts, negative_per_document_hits = (
+            _scan_fit_documents(negative_documents)
+        )
 
-        positive_matches = sum(1 for count in positive_per_document_hits if count > 0)
-        negative_matches = sum(1 for count in negative_per_document_hits if count > 0)
+        positive_hit_counts = [
+            count for count in positive_per_document_hits if count > 0
+        ]
+        negative_hit_counts = [
+            count for count in negative_per_document_hits if count > 0
+        ]
+        positive_matches = len(positive_hit_counts)
+        negative_matches = len(negative_hit_counts)
 
-        positive_repeated_ngram_min_n = clamp_int(
-            percentile_floor(positive_n_values, 0.20), 2, 12
-        )
+        n_value_low, n_value_high = percentiles(positive_n_values, (0.20, 0.90))
+        positive_repeated_ngram_min_n = clamp_int(math.floor(n_value_low), 2, 12)
         repeated_ngram_min_n = clamp_int(
             math.ceil(
                 fit_threshold_high_contrastive(
@@ -229,9 +226,7 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
             12,
         )
         repeated_ngram_max_n = fit_count_cap_contrastive(
-            default_value=clamp_int(
-                percentile_ceil(positive_n_values, 0.90), repeated_ngram_min_n, 16
-            ),
+            default_value=clamp_int(math.ceil(n_value_high), repeated_ngram_min_n, 16),
             positive_values=positive_n_values,
             negative_values=negative_n_values,
             lower=repeated_ngram_min_n,
@@ -262,21 +257,11 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
         )
 
         record_cap = fit_count_cap_contrastive(
-            default_value=clamp_int(
-                percentile_ceil(
-                    [count for count in positive_per_document_hits if count > 0], 0.90
-                ),
-                1,
-                128,
-            )
+            default_value=clamp_int(percentile_ceil(positive_hit_counts, 0.90), 1, 128)
             if positive_matches > 0
             else self.config.record_cap,
-            positive_values=[
-                count for count in positive_per_document_hits if count > 0
-            ],
-            negative_values=[
-                count for count in negative_per_document_hits if count > 0
-            ],
+            positive_values=positive_hit_counts,
+            negative_values=negative_hit_counts,
             lower=1,
             upper=128,
             positive_quantile=0.90,
@@ -288,9 +273,9 @@ class PhraseReuseRule(Rule[PhraseReuseRuleConfig]):
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             record_cap=record_cap,
             repeated_ngram_min_n=repeated_ngram_min_n,
@@ -29,11 +29,39 @@ from slop_guard.rules.fitting import (
     fit_penalty_contrastive,
     fit_threshold_high_contrastive,
     fit_threshold_low_contrastive,
+    length_cv,
     percentile_floor,
 )
 
 
-@dataclass
+def _rhythm_fit_statistics(
+    documents: list[AnalysisDocument],
+) -> tuple[list[int], list[float]]:
+    """Collect sentence counts and sentence-length CVs in one pass.
+
+    Args:
+        documents: Analysis documents from one label class.
+
+    Returns:
+        Sentence counts for documents with at least one sentence, and CVs for
+        documents with at least two sentences and a positive mean length.
+    """
+    sentence_counts: list[int] = []
+    cv_values: list[float] = []
+    for document in documents:
+        lengths = document.sentence_word_counts
+        if not lengths:
+            continue
+        sentence_counts.append(len(lengths))
+        if len(lengths) < 2:
+            continue
+        cv = length_cv(lengths)
+        if cv != math.inf:
+            cv_values.append(cv)
+    return sentence_counts, cv_values
+
+
+@dataclass(slots=True)
 class RhythmRuleConfig(RuleConfig):
     """Config for rhythm variance thresholding."""
 
@@ -105,20 +133,15 @@ class RhythmRule(Rule[RhythmRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Compute sentence-length CV and emit a rhythm violation if low."""
-        sentence_count = len(document.sentence_word_counts)
-        if sentence_count < self.config.min_sentences:
-            return RuleResult()
-
         lengths = document.sentence_word_counts
-        mean = sum(lengths) / sentence_count
-        if mean <= 0:
+        sentence_count = len(lengths)
+        if sentence_count < self.config.min_sentences:
             return RuleResult()
 
-        variance = sum((value - mean) ** 2 for value in lengths) / sentence_count
-        std = math.sqrt(variance)
-        cv = std / mean
+        cv = length_cv(lengths)
         if cv >= self.config.cv_threshold:
             return RuleResult()
+        mean = sum(lengths) / sentence_count
         shortest = min(lengths)
         longest = max(lengths)
 
@@ -145,52 +168,26 @@ class RhythmRule(Rule[RhythmRuleConfig]):
             count_deltas={self.count_key: 1},
         )
 
-    def _fit(self, samples: list[str], labels: list[Label] | None) -> RhythmRuleConfig:
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
+    ) -> RhythmRuleConfig:
         """Fit rhythm thresholds from sentence-length distributions."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        positive_sentence_counts: list[int] = []
-        positive_cv_values: list[float] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
-            sentence_count = len(document.sentence_word_counts)
-            if sentence_count <= 0:
-                continue
-            positive_sentence_counts.append(sentence_count)
-            if sentence_count < 2:
-                continue
-            mean = sum(document.sentence_word_counts) / sentence_count
-            if mean <= 0:
-                continue
-            variance = (
-                sum((value - mean) ** 2 for value in document.sentence_word_counts)
-                / sentence_count
-            )
-            positive_cv_values.append(math.sqrt(variance) / mean)
+        positive_sentence_counts, positive_cv_values = _rhythm_fit_statistics(
+            positive_documents
+        )
 
         if not positive_sentence_counts:
             return self.config
 
-        negative_sentence_counts: list[int] = []
-        negative_cv_values: list[float] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
-            sentence_count = len(document.sentence_word_counts)
-            if sentence_count <= 0:
-                continue
-            negative_sentence_counts.append(sentence_count)
-            if sentence_count < 2:
-                continue
-            mean = sum(document.sentence_word_counts) / sentence_count
-            if mean <= 0:
-                continue
-            variance = (
-                sum((value - mean) ** 2 for value in document.sentence_word_counts)
-                / sentence_count
-            )
-            negative_cv_values.append(math.sqrt(variance) / mean)
+        negative_sentence_counts, negative_cv_values = _rhythm_fit_statistics(
+            negative_documents
+        )
 
         min_sentences = clamp_int(
             math.ceil(
@@ -233,9 +230,9 @@ class RhythmRule(Rule[RhythmRuleConfig]):
         penalty = fit_penalty_contrastive(
             base_penalty=self.config.penalty,
             positive_matches=positive_matches,
-            positive_total=len(positive_samples),
+            positive_total=len(positive_documents),
             negative_matches=negative_matches,
-            negative_total=len(negative_samples),
+            negative_total=len(negative_documents),
         )
 
         return RhythmRuleConfig(
@@ -2,8 +2,9 @@
 
 import json
 import math
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import fields, is_dataclass
+from functools import cache
 from importlib.resources import files
 from pathlib import Path
 from typing import Any, TypeAlias
@@ -13,7 +14,7 @@ from slop_guard.document import AnalysisDocument
 from slop_guard.models import AnalysisState
 from slop_guard.scoring import compute_weighted_sum
 
-from .base import Label, Rule, RuleConfig
+from .base import Label, Rule, RuleConfig, validate_fit_inputs
 from .registry import resolve_rule_type, rule_type_name
 
 RuleList: TypeAlias = list[Rule[Any]]
@@ -50,22 +51,23 @@ class Pipeline:
 
     def to_jsonl(self, path: str | Path) -> None:
         """Write this pipeline's rule settings to a JSONL file."""
-        output_path = Path(path)
-        with output_path.open("w", encoding="utf-8") as handle:
-            for rule in self.rules:
-                payload = {
+        lines = [
+            json.dumps(
+                {
                     _RULE_TYPE_FIELD: rule_type_name(type(rule)),
                     _CONFIG_FIELD: rule.to_dict(),
-                }
-                handle.write(json.dumps(payload, sort_keys=True))
-                handle.write("\n")
+                },
+                sort_keys=True,
+            )
+            for rule in self.rules
+        ]
+        Path(path).write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
 
     def forward(self, document: AnalysisDocument) -> AnalysisState:
         """Apply all rules in order and merge their outputs."""
-        state = AnalysisState.initial(self.count_keys)
-        for rule in self.rules:
-            state = state.merge(rule.forward(document))
-        return state
+        return AnalysisState.initial(self.count_keys).merge_all(
+            rule.forward(document) for rule in self.rules
+        )
 
     def fit(
         self,
@@ -83,16 +85,18 @@ class Pipeline:
             calibrate_contrastive: Whether to run post-fit contrastive penalty
                 calibration when both positive and negative labels exist.
         """
+        validate_fit_inputs(samples, labels)
         fit_labels = labels if labels is not None else [1] * len(samples)
+        documents = [AnalysisDocument.from_text(sample) for sample in samples]
         for rule in self.rules:
-            rule.fit(samples, fit_labels)
+            rule.fit_documents(documents, fit_labels)
         if calibrate_contrastive:
-            self._calibrate_contrastive_penalties(samples, fit_labels)
+            self._calibrate_contrastive_penalties(documents, fit_labels)
         return self
 
     def _calibrate_contrastive_penalties(
         self,
-        samples: list[str],
+        documents: list[AnalysisDocument],
         labels: list[Label],
     ) -> None:
         """Calibrate penalties so fitted rules separate positives from negatives.
@@ -106,7 +110,6 @@ class Pipeline:
         if not has_positive or not has_negative:
             return
 
-        documents = [AnalysisDocument.from_text(sample) for sample in samples]
         positive_indices = [index for index, label in enumerate(labels) if label > 0]
         negative_indices = [index for index, label in enumerate(labels) if label <= 0]
 
@@ -159,16 +162,28 @@ def run_rule_pipeline(
     return Pipeline(rules).forward(document)
 
 
-def _read_jsonl_lines(path: str | Path | None) -> list[str]:
-    """Read raw JSONL lines from a path or packaged defaults."""
+@cache
+def _packaged_default_lines() -> tuple[str, ...]:
+    """Read the packaged default JSONL once and cache its immutable lines."""
+    raw_text = (
+        files("slop_guard.rules")
+        .joinpath("assets/default.jsonl")
+        .read_text(encoding="utf-8")
+    )
+    return tuple(raw_text.splitlines())
+
+
+def _read_jsonl_lines(path: str | Path | None) -> Iterator[str]:
+    """Yield raw JSONL lines from a path or packaged defaults.
+
+    Files are streamed line by line rather than read whole, so parsing a
+    rule-settings file never holds more than one line in memory.
+    """
     if path is None:
-        raw_text = (
-            files("slop_guard.rules")
-            .joinpath("assets/default.jsonl")
-            .read_text(encoding="utf-8")
-        )
-        return raw_text.splitlines()
-    return Path(path).read_text(encoding="utf-8").splitlines()
+        yield from _packaged_default_lines()
+        return
+    with Path(path).open(encoding="utf-8") as handle:
+        yield from handle
 
 
 def _parse_rules_from_jsonl(lines: Iterable[str]) -> RuleList:
@@ -49,7 +49,39 @@ _AI_DISCLOSURE_COMPLEX_PATTERNS: tuple[re.Pattern[str], ...] = (
 )
 
 
-@dataclass
+def _contains_ai_disclosure(text: str, lower_text: str) -> bool:
+    """Return whether a sample contains any AI-disclosure phrase.
+
+    ASCII samples only run a regex when its literal anchor is present, so
+    the common no-hit sample costs a handful of C-level substring scans.
+
+    Args:
+        text: Source text to scan.
+        lower_text: Lowercased ``text``, used for literal and anchor checks.
+
+    Returns:
+        Whether any literal or complex disclosure pattern matches.
+    """
+    if any(phrase in lower_text for phrase in _AI_DISCLOSURE_LITERALS):
+        return True
+    if not text.isascii():
+        return any(
+            pattern.search(text) is not None
+            for pattern in _AI_DISCLOSURE_COMPLEX_PATTERNS
+        )
+    if (
+        "as of my" in lower_text
+        and "cutoff" in lower_text
+        and _AI_DISCLOSURE_CUTOFF_RE.search(text) is not None
+    ):
+        return True
+    return (
+        "i'm just a" in lower_text
+        and _AI_DISCLOSURE_JUST_AI_RE.search(text) is not None
+    )
+
+
+@dataclass(slots=True)
 class AIDisclosureRuleConfig(RuleConfig):
     """Config for AI self-disclosure pattern matching."""
 
@@ -94,173 +126,95 @@ class AIDisclosureRule(Rule[AIDisclosureRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Apply disclosure regex checks to the text."""
-        violations: list[Violation] = []
-        advice: list[str] = []
-        count = 0
+        text = document.text
+        hits: list[tuple[str, int, int]] = []
 
-        if document.text.isascii():
+        if text.isascii():
             lower_text = document.lower_text
-            for index, phrase in enumerate(_AI_DISCLOSURE_LITERALS):
-                phrase_len = _AI_DISCLOSURE_LITERAL_LENGTHS[index]
-                start = 0
-                while True:
-                    hit_start = lower_text.find(phrase, start)
-                    if hit_start < 0:
-                        break
+            find = lower_text.find
+            for phrase, phrase_len in zip(
+                _AI_DISCLOSURE_LITERALS, _AI_DISCLOSURE_LITERAL_LENGTHS
+            ):
+                hit_start = find(phrase)
+                while hit_start >= 0:
                     hit_end = hit_start + phrase_len
-                    violations.append(
-                        Violation(
-                            rule=self.name,
-                            match=phrase,
-                            context=context_around(
-                                document.text,
-                                hit_start,
-                                hit_end,
-                                width=self.config.context_window_chars,
-                            ),
-                            penalty=self.config.penalty,
-                        )
-                    )
-                    advice.append(
-                        "Remove "
-                        f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
-                    )
-                    count += 1
-                    start = hit_end
+                    hits.append((phrase, hit_start, hit_end))
+                    hit_start = find(phrase, hit_end)
 
+            # ASCII lowercasing preserves offsets, so complex hits are
+            # matched and sliced from lower_text without re-lowercasing.
+            complex_patterns: list[re.Pattern[str]] = []
             if "as of my" in lower_text and "cutoff" in lower_text:
-                for match in _AI_DISCLOSURE_CUTOFF_RE.finditer(document.text):
-                    phrase = match.group(0).lower()
-                    violations.append(
-                        Violation(
-                            rule=self.name,
-                            match=phrase,
-                            context=context_around(
-                                document.text,
-                                match.start(),
-                                match.end(),
-                                width=self.config.context_window_chars,
-                            ),
-                            penalty=self.config.penalty,
-                        )
-                    )
-                    advice.append(
-                        "Remove "
-                        f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
-                    )
-                    count += 1
-
+                complex_patterns.append(_AI_DISCLOSURE_CUTOFF_RE)
             if "i'm just a" in lower_text:
-                for match in _AI_DISCLOSURE_JUST_AI_RE.finditer(document.text):
-                    phrase = match.group(0).lower()
-                    violations.append(
-                        Violation(
-                            rule=self.name,
-                            match=phrase,
-                            context=context_around(
-                                document.text,
-                                match.start(),
-                                match.end(),
-                                width=self.config.context_window_chars,
-                            ),
-                            penalty=self.config.penalty,
-                        )
-                    )
-                    advice.append(
-                        "Remove "
-                        f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
-                    )
-                    count += 1
+                complex_patterns.append(_AI_DISCLOSURE_JUST_AI_RE)
+            for pattern in complex_patterns:
+                hits.extend(
+                    (match.group(0), match.start(), match.end())
+                    for match in pattern.finditer(lower_text)
+                )
         else:
-            for pattern in _AI_DISCLOSURE_LITERAL_PATTERNS:
-                for match in pattern.finditer(document.text):
-                    phrase = match.group(0).lower()
-                    violations.append(
-                        Violation(
-                            rule=self.name,
-                            match=phrase,
-                            context=context_around(
-                                document.text,
-                                match.start(),
-                                match.end(),
-                                width=self.config.context_window_chars,
-                            ),
-                            penalty=self.config.penalty,
-                        )
-                    )
-                    advice.append(
-                        "Remove "
-                        f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
-                    )
-                    count += 1
-
-            for pattern in _AI_DISCLOSURE_COMPLEX_PATTERNS:
-                for match in pattern.finditer(document.text):
-                    phrase = match.group(0).lower()
-                    violations.append(
-                        Violation(
-                            rule=self.name,
-                            match=phrase,
-                            context=context_around(
-                                document.text,
-                                match.start(),
-                                match.end(),
-                                width=self.config.context_window_chars,
-                            ),
-                            penalty=self.config.penalty,
-                        )
-                    )
-                    advice.append(
-                        "Remove "
-                        f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
-                    )
-                    count += 1
-
+            for pattern in (
+                *_AI_DISCLOSURE_LITERAL_PATTERNS,
+                *_AI_DISCLOSURE_COMPLEX_PATTERNS,
+            ):
+                hits.extend(
+                    (match.group(0).lower(), match.start(), match.end())
+                    for match in pattern.finditer(text)
+                )
+
+        if not hits:
+            return RuleResult()
+
+        name = self.name
+        penalty = self.config.penalty
+        width = self.config.context_window_chars
+        violations = [
+            Violation(
+                rule=name,
+                match=phrase,
+                context=context_around(text, hit_start, hit_end, width=width),
+                penalty=penalty,
+            )
+            for phrase, hit_start, hit_end in hits
+        ]
+        advice = [
+            "Remove "
+            f"'{phrase}' \u2014 AI self-disclosure in authored prose is a critical tell."
+            for phrase, _, _ in hits
+        ]
         return RuleResult(
             violations=violations,
             advice=advice,
-            count_deltas={self.count_key: count} if count else {},
+            count_deltas={self.count_key: len(hits)},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> AIDisclosureRuleConfig:
         """Fit penalty from empirical AI-disclosure prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
-        positive_matches = 0
-        for sample in positive_samples:
-            lower_text = sample.lower()
-            if any(phrase in lower_text for phrase in _AI_DISCLOSURE_LITERALS):
-                positive_matches += 1
-                continue
-            if _AI_DISCLOSURE_CUTOFF_RE.search(sample) is not None:
-                positive_matches += 1
-                continue
-            if _AI_DISCLOSURE_JUST_AI_RE.search(sample) is not None:
-                positive_matches += 1
-
-        negative_matches = 0
-        for sample in negative_samples:
-            lower_text = sample.lower()
-            if any(phrase in lower_text for phrase in _AI_DISCLOSURE_LITERALS):
-                negative_matches += 1
-                continue
-            if _AI_DISCLOSURE_CUTOFF_RE.search(sample) is not None:
-                negative_matches += 1
-                continue
-            if _AI_DISCLOSURE_JUST_AI_RE.search(sample) is not None:
-                negative_matches += 1
+        positive_matches = sum(
+            _contains_ai_disclosure(document.text, document.lower_text)
+            for document in positive_documents
+        )
+        negative_matches = sum(
+            _contains_ai_disclosure(document.text, document.lower_text)
+            for document in negative_documents
+        )
 
         return AIDisclosureRuleConfig(
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             context_window_chars=self.config.context_window_chars,
         )
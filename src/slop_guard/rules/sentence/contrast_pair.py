@@ -52,23 +52,36 @@ ContrastMatchKind: TypeAlias = Literal["x_not_y", "staged_contrast"]
 ContrastMatch: TypeAlias = tuple[ContrastMatchKind, int, int, str]
 
 
-def _collect_contrast_matches(text: str) -> tuple[ContrastMatch, ...]:
+def _collect_contrast_matches(text: str, lower_text: str) -> tuple[ContrastMatch, ...]:
     """Return ordered contrast matches detected in ``text``.
 
+    Each regex only runs when its required literal is present, so texts
+    without contrast markers cost two substring scans instead of two regex
+    passes.
+
     Args:
         text: Source text to scan.
+        lower_text: Lowercased ``text``, used to anchor the case-insensitive
+            staged-contrast pattern.
 
     Returns:
         Ordered match tuples containing match kind, character offsets, and the
         matched snippet.
     """
     matches: list[ContrastMatch] = []
-    for match in _X_NOT_Y_RE.finditer(text):
-        matches.append(("x_not_y", match.start(), match.end(), match.group(0)))
-    for match in _STAGED_CONTRAST_RE.finditer(text):
-        matches.append(
-            ("staged_contrast", match.start(), match.end(), match.group(0).strip())
-        )
+    if ", not " in text:
+        for match in _X_NOT_Y_RE.finditer(text):
+            matches.append(("x_not_y", match.start(), match.end(), match.group(0)))
+    if "not " in lower_text:
+        for match in _STAGED_CONTRAST_RE.finditer(text):
+            matches.append(
+                (
+                    "staged_contrast",
+                    match.start(),
+                    match.end(),
+                    match.group(0).strip(),
+                )
+            )
     matches.sort(key=lambda item: (item[1], item[2], item[0]))
     return tuple(matches)
 
@@ -119,7 +132,7 @@ def _contrast_summary_advice(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContrastPairRuleConfig(RuleConfig):
     """Config for contrast pair detection and recording limits."""
 
@@ -180,7 +193,7 @@ class ContrastPairRule(Rule[ContrastPairRuleConfig]):
 
     def forward(self, document: AnalysisDocument) -> RuleResult:
         """Apply contrast detection and aggregate advice."""
-        matches = _collect_contrast_matches(document.text)
+        matches = _collect_contrast_matches(document.text, document.lower_text)
         violations: list[Violation] = []
         advice: list[str] = []
 
@@ -214,19 +227,23 @@ class ContrastPairRule(Rule[ContrastPairRuleConfig]):
             count_deltas={self.count_key: len(violations)} if violations else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> ContrastPairRuleConfig:
         """Fit match-driven caps and penalties from corpus counts."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_counts = [
-            len(_collect_contrast_matches(sample)) for sample in positive_samples
+            len(_collect_contrast_matches(document.text, document.lower_text))
+            for document in positive_documents
         ]
         negative_counts = [
-            len(_collect_contrast_matches(sample)) for sample in negative_samples
+            len(_collect_contrast_matches(document.text, document.lower_text))
+            for document in negative_documents
         ]
         positive_matches = sum(1 for count in positive_counts if count > 0)
         negative_matches = sum(1 for count in negative_counts if count > 0)
@@ -271,9 +288,9 @@ class ContrastPairRule(Rule[ContrastPairRuleConfig]):
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             record_cap=record_cap,
             advice_min=advice_min,
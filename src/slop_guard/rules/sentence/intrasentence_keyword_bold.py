@@ -178,7 +178,7 @@ def _collect_keyword_bold_matches(
     return tuple(survivors)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntrasentenceKeywordBoldRuleConfig(RuleConfig):
     """Config for the intra-sentence keyword bold detector."""
 
@@ -286,29 +286,23 @@ class IntrasentenceKeywordBoldRule(Rule[IntrasentenceKeywordBoldRuleConfig]):
             count_deltas={self.count_key: len(matches)} if matches else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> IntrasentenceKeywordBoldRuleConfig:
         """Fit cap and penalty from positive vs negative bold prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_counts = [
-            len(
-                _collect_keyword_bold_matches(
-                    AnalysisDocument.from_text(sample), self.config.max_words
-                )
-            )
-            for sample in positive_samples
+            len(_collect_keyword_bold_matches(document, self.config.max_words))
+            for document in positive_documents
         ]
         negative_counts = [
-            len(
-                _collect_keyword_bold_matches(
-                    AnalysisDocument.from_text(sample), self.config.max_words
-                )
-            )
-            for sample in negative_samples
+            len(_collect_keyword_bold_matches(document, self.config.max_words))
+            for document in negative_documents
         ]
         positive_matches = sum(1 for count in positive_counts if count > 0)
         negative_matches = sum(1 for count in negative_counts if count > 0)
@@ -343,9 +337,9 @@ class IntrasentenceKeywordBoldRule(Rule[IntrasentenceKeywordBoldRuleConfig]):
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             record_cap=record_cap,
             advice_min=advice_min,
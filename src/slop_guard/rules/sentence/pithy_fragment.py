@@ -32,10 +32,11 @@ from slop_guard.rules.fitting import (
     fit_threshold_low_contrastive,
 )
 
+# Every pivot starts with a comma, so sentences without one skip the regex.
 _PITHY_PIVOT_RE = re.compile(r",\s+(?:but|yet|and|not|or)\b", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True)
 class PithyFragmentRuleConfig(RuleConfig):
     """Config for pithy fragment thresholds."""
 
@@ -97,7 +98,10 @@ class PithyFragmentRule(Rule[PithyFragmentRuleConfig]):
         ):
             if sentence_words > self.config.max_sentence_words:
                 continue
-            if _PITHY_PIVOT_RE.search(sentence_text) is None:
+            if (
+                "," not in sentence_text
+                or _PITHY_PIVOT_RE.search(sentence_text) is None
+            ):
                 continue
 
             if count < self.config.record_cap:
@@ -121,23 +125,27 @@ class PithyFragmentRule(Rule[PithyFragmentRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> PithyFragmentRuleConfig:
         """Fit pithy fragment thresholds from corpus sentence patterns."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_lengths: list[int] = []
         positive_counts: list[int] = []
-        for sample in positive_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in positive_documents:
             sample_count = 0
             for sentence_text, sentence_words in zip(
                 document.sentences, document.sentence_word_counts
             ):
-                if _PITHY_PIVOT_RE.search(sentence_text) is None:
+                if (
+                    "," not in sentence_text
+                    or _PITHY_PIVOT_RE.search(sentence_text) is None
+                ):
                     continue
                 positive_lengths.append(sentence_words)
                 sample_count += 1
@@ -148,13 +156,15 @@ class PithyFragmentRule(Rule[PithyFragmentRuleConfig]):
 
         negative_lengths: list[int] = []
         negative_counts: list[int] = []
-        for sample in negative_samples:
-            document = AnalysisDocument.from_text(sample)
+        for document in negative_documents:
             sample_count = 0
             for sentence_text, sentence_words in zip(
                 document.sentences, document.sentence_word_counts
             ):
-                if _PITHY_PIVOT_RE.search(sentence_text) is None:
+                if (
+                    "," not in sentence_text
+                    or _PITHY_PIVOT_RE.search(sentence_text) is None
+                ):
                     continue
                 negative_lengths.append(sentence_words)
                 sample_count += 1
@@ -195,9 +205,9 @@ class PithyFragmentRule(Rule[PithyFragmentRuleConfig]):
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             max_sentence_words=max_sentence_words,
             record_cap=record_cap,
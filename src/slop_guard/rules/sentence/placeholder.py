@@ -33,7 +33,7 @@ _PLACEHOLDER_RE = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceholderRuleConfig(RuleConfig):
     """Config for placeholder text detection."""
 
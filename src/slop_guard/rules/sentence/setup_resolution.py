@@ -52,7 +52,7 @@ _SETUP_RESOLUTION_B_RE = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupResolutionRuleConfig(RuleConfig):
     """Config for setup-resolution pattern detection."""
 
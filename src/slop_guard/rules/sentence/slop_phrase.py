@@ -196,7 +196,7 @@ def _slop_phrase_advice(phrase: str) -> str:
     return f"Cut '{phrase}' — replace the setup with the actual point."
 
 
-@dataclass
+@dataclass(slots=True)
 class SlopPhraseRuleConfig(RuleConfig):
     """Config for phrase-level slop pattern matching."""
 
@@ -71,7 +71,7 @@ def _false_narrativity_advice(phrase: str) -> str:
     return f"Cut '{phrase}' — replace the announcement with the actual point."
 
 
-@dataclass
+@dataclass(slots=True)
 class ToneMarkerRuleConfig(RuleConfig):
     """Config for tone marker pattern matching."""
 
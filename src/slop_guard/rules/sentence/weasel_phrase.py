@@ -43,7 +43,7 @@ _WEASEL_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaselPhraseRuleConfig(RuleConfig):
     """Config for weasel phrase detection."""
 
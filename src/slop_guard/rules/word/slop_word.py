@@ -228,7 +228,7 @@ def _is_probable_proper_noun_match(text: str, match: re.Match[str]) -> bool:
     return _TITLE_CASE_NAME_TOKEN_RE.fullmatch(next_token) is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class SlopWordRuleConfig(RuleConfig):
     """Config for slop word matching behavior."""
 
@@ -321,37 +321,33 @@ class SlopWordRule(Rule[SlopWordRuleConfig]):
             count_deltas={self.count_key: count} if count else {},
         )
 
-    def _fit(
-        self, samples: list[str], labels: list[Label] | None
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
     ) -> SlopWordRuleConfig:
         """Fit penalty strength from observed slop-word prevalence."""
-        positive_samples, negative_samples = self._split_fit_samples(samples, labels)
-        if not positive_samples:
+        positive_documents, negative_documents = self._split_fit_samples(
+            documents, labels
+        )
+        if not positive_documents:
             return self.config
 
         positive_matches = sum(
             1
-            for sample in positive_samples
-            if _SLOP_WORD_RE.search(
-                AnalysisDocument.from_text(sample).text_with_markdown_code_masked
-            )
-            is not None
+            for document in positive_documents
+            if _SLOP_WORD_RE.search(document.text_with_markdown_code_masked) is not None
         )
         negative_matches = sum(
             1
-            for sample in negative_samples
-            if _SLOP_WORD_RE.search(
-                AnalysisDocument.from_text(sample).text_with_markdown_code_masked
-            )
-            is not None
+            for document in negative_documents
+            if _SLOP_WORD_RE.search(document.text_with_markdown_code_masked) is not None
         )
         return SlopWordRuleConfig(
             penalty=fit_penalty_contrastive(
                 base_penalty=self.config.penalty,
                 positive_matches=positive_matches,
-                positive_total=len(positive_samples),
+                positive_total=len(positive_documents),
                 negative_matches=negative_matches,
-                negative_total=len(negative_samples),
+                negative_total=len(negative_documents),
             ),
             context_window_chars=self.config.context_window_chars,
         )
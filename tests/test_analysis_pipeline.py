@@ -237,6 +237,8 @@ def test_analysis_document_cached_views() -> None:
     assert document.sentence_word_counts == tuple(
         len(sentence.split()) for sentence in document.sentences
     )
+    assert document.paragraph_word_counts == (14, 10)
+    assert document.em_dash_count == 0
     assert document.non_empty_lines == tuple(
         line for line in document.lines if line.strip()
     )
@@ -253,6 +255,21 @@ def test_analysis_document_cached_views() -> None:
     assert "code: true" not in document.text_with_markdown_code_masked
 
 
+def test_analysis_document_paragraph_breaks_accept_whitespace_blank_lines() -> None:
+    """Paragraph splitting should treat padded and CRLF blank lines as breaks."""
+    text = "one two\n \nthree\r\n\r\nfour five six\n\t\n\nseven"
+    document = AnalysisDocument.from_text(text)
+
+    assert document.paragraph_word_counts == (2, 1, 3, 1)
+
+
+def test_analysis_document_em_dash_count_matches_both_dash_forms() -> None:
+    """Em-dash counting should include unicode dashes and spaced double hyphens."""
+    document = AnalysisDocument.from_text("One \u2014 two -- three --four -- -- five.")
+
+    assert document.em_dash_count == 3
+
+
 def test_analysis_document_sentence_analysis_strips_markdown_blocks() -> None:
     """Sentence analysis should ignore fenced code blocks and pipe tables."""
     text = (
@@ -0,0 +1,38 @@
+"""Tests for shared repeated n-gram helpers."""
+
+from slop_guard.config import Hyperparameters
+from slop_guard.rules.ngrams import find_repeated_ngrams_from_tokens
+
+_SCAN_HP = Hyperparameters(
+    repeated_ngram_min_n=2,
+    repeated_ngram_max_n=4,
+    repeated_ngram_min_count=2,
+)
+
+
+def test_repeated_ngrams_keep_only_maximal_spans() -> None:
+    """Shorter grams covered by an equally frequent longer gram are dropped."""
+    tokens = tuple("we deploy canary builds then we deploy canary builds".split())
+
+    hits = find_repeated_ngrams_from_tokens(tokens, _SCAN_HP)
+
+    assert hits == [("we deploy canary builds", 2, 4)]
+
+
+def test_repeated_ngrams_keep_more_frequent_subphrases() -> None:
+    """A sub-phrase survives when it repeats more often than its superspan."""
+    tokens = tuple("red blue green then red blue green and red blue".split())
+
+    hits = find_repeated_ngrams_from_tokens(tokens, _SCAN_HP)
+
+    assert hits == [
+        ("red blue green", 2, 3),
+        ("red blue", 3, 2),
+    ]
+
+
+def test_repeated_ngrams_skip_stopword_only_grams() -> None:
+    """Grams made entirely of stopwords never count as phrase reuse."""
+    tokens = tuple("of the and of the and of the".split())
+
+    assert find_repeated_ngrams_from_tokens(tokens, _SCAN_HP) == []
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, cast
+
+import pytest
 
 from slop_guard.config import DEFAULT_HYPERPARAMETERS
 from slop_guard.document import AnalysisDocument
@@ -41,6 +44,16 @@ def test_pipeline_from_jsonl_matches_builtin_catalog_order() -> None:
     )
 
 
+def test_pipeline_from_jsonl_builds_independent_default_configs() -> None:
+    """Cached packaged defaults must still yield fresh rule configs per load."""
+    first = Pipeline.from_jsonl()
+    second = Pipeline.from_jsonl()
+
+    for first_rule, second_rule in zip(first.rules, second.rules, strict=True):
+        assert first_rule.config is not second_rule.config
+        assert first_rule.to_dict() == second_rule.to_dict()
+
+
 def test_pipeline_forward_matches_legacy_helper() -> None:
     """Pipeline.forward should match the helper-style pipeline execution."""
     document = AnalysisDocument.from_text(
@@ -104,6 +117,49 @@ def test_pipeline_fit_runs_all_rules_and_supports_default_labels() -> None:
     assert second.config.fit_count == 2
 
 
+def test_pipeline_fit_validates_samples_before_building_documents() -> None:
+    """Pipeline.fit should reject non-string samples with the fit message."""
+    pipeline = Pipeline([_RecordingRule(_RecordingConfig(fit_count=0))])
+
+    invalid_samples = cast(Any, ["ok", 3])
+    with pytest.raises(TypeError, match="samples must be a list of strings"):
+        pipeline.fit(invalid_samples)
+
+    with pytest.raises(ValueError, match="same length"):
+        pipeline.fit(["ok"], [1, 0])
+
+
+class _DocumentRecordingRule(_RecordingRule):
+    """Test helper rule that records the documents passed to fit."""
+
+    fit_documents_calls: list[list[AnalysisDocument]] = []
+
+    def _fit_documents(
+        self, documents: list[AnalysisDocument], labels: list[Label] | None
+    ) -> _RecordingConfig:
+        """Record fit documents and increment fit count."""
+        _ = labels
+        self.fit_documents_calls.append(list(documents))
+        return _RecordingConfig(fit_count=self.config.fit_count + 1)
+
+
+def test_pipeline_fit_shares_one_document_per_sample_across_rules() -> None:
+    """Pipeline.fit should build documents once and hand them to every rule."""
+    _DocumentRecordingRule.fit_documents_calls = []
+
+    pipeline = Pipeline(
+        [
+            _DocumentRecordingRule(_RecordingConfig(fit_count=0)),
+            _DocumentRecordingRule(_RecordingConfig(fit_count=0)),
+        ]
+    )
+    pipeline.fit(["alpha", "beta"])
+
+    first, second = _DocumentRecordingRule.fit_documents_calls
+    assert [document.text for document in first] == ["alpha", "beta"]
+    assert all(left is right for left, right in zip(first, second))
+
+
 @dataclass
 class _MarkerPenaltyConfig(RuleConfig):
     """Config for marker-triggered penalty test rules."""
@@ -1,5 +1,7 @@
 """Tests for empirical per-rule fitting behavior."""
 
+import math
+import statistics
 from copy import deepcopy
 from typing import TypeAlias
 
@@ -7,6 +9,7 @@ import pytest
 
 from slop_guard.document import AnalysisDocument
 from slop_guard.rules import Rule, build_default_rules
+from slop_guard.rules.fitting import length_cv, percentile, percentiles
 from slop_guard.rules.paragraph import (
     BlockquoteDensityRule,
     BoldTermBulletRunRule,
@@ -208,7 +211,11 @@ FIT_CASES: tuple[FitCase, ...] = (
 def test_all_default_rules_override_base_fit_impl() -> None:
     """Each concrete default rule should override the base no-op fit path."""
     for rule in build_default_rules():
-        assert type(rule)._fit is not Rule._fit
+        rule_type = type(rule)
+        assert (
+            rule_type._fit is not Rule._fit
+            or rule_type._fit_documents is not Rule._fit_documents
+        )
 
 
 @pytest.mark.parametrize(("rule_cls", "field_name", "corpus"), FIT_CASES)
@@ -274,3 +281,26 @@ def test_fit_thresholds_align_with_inclusive_count_based_rules() -> None:
 
     assert negative_hits > positive_hits
     assert fitted.config.penalty < 0
+
+
+def test_batched_percentiles_match_single_percentile() -> None:
+    """One sort should reproduce each individually computed percentile."""
+    values = [7, 1, 4, 4, 10, 2]
+    quantiles = (0.0, 0.2, 0.5, 0.9, 1.0)
+
+    assert percentiles(values, quantiles) == tuple(
+        percentile(values, quantile) for quantile in quantiles
+    )
+    with pytest.raises(ValueError):
+        percentiles(values, (0.5, 1.5))
+
+
+def test_length_cv_matches_population_statistics() -> None:
+    """Closed-form CV should match pstdev / mean and guard a zero mean."""
+    lengths = (3, 9, 4, 12, 7)
+
+    assert length_cv(lengths) == pytest.approx(
+        statistics.pstdev(lengths) / statistics.mean(lengths)
+    )
+    assert length_cv((5, 5, 5)) == 0.0
+    assert length_cv((0, 0)) == math.inf
@@ -6,7 +6,9 @@ import pytest
 
 from slop_guard.config import DEFAULT_HYPERPARAMETERS
 from slop_guard.document import AnalysisDocument
+from slop_guard.models import AnalysisState, RuleResult, Violation
 from slop_guard.rules import Pipeline, Rule, RuleConfig, RuleLevel
+from slop_guard.rules.sentence import WeaselPhraseRule, WeaselPhraseRuleConfig
 from slop_guard.rules.word import SlopWordRule, SlopWordRuleConfig
 
 
@@ -22,6 +24,42 @@ def test_default_pipeline_covers_all_levels() -> None:
     }
 
 
+def test_analysis_state_merge_all_matches_sequential_merges() -> None:
+    """Batch merging should preserve order and sum count deltas like merge."""
+    results = [
+        RuleResult(
+            violations=[Violation(rule="a", match="x", context="x", penalty=-1)],
+            advice=["first"],
+            count_deltas={"a": 1},
+        ),
+        RuleResult(),
+        RuleResult(advice=["second"], count_deltas={"a": 2, "b": 0}),
+    ]
+
+    sequential = AnalysisState.initial(("a",))
+    for result in results:
+        sequential = sequential.merge(result)
+    batched = AnalysisState.initial(("a",)).merge_all(results)
+
+    assert batched == sequential
+    assert batched.advice == ("first", "second")
+    assert batched.counts["a"] == 3
+
+
+def test_raw_text_rule_fit_never_builds_documents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rules that only override ``_fit`` should fit on the raw samples."""
+
+    def fail_from_text(text: str) -> AnalysisDocument:
+        raise AssertionError(f"unexpected document build for {text!r}")
+
+    monkeypatch.setattr(AnalysisDocument, "from_text", fail_from_text)
+    rule = WeaselPhraseRule(WeaselPhraseRuleConfig(penalty=-2, context_window_chars=60))
+
+    assert rule.fit(["Some experts say it works.", "Plain text."], [1, 0]) is rule
+
+
 def test_rule_fit_validates_inputs_and_returns_self() -> None:
     """Base fit path should validate shape/types and behave scikit-style."""
     rule = SlopWordRule(
@@ -49,6 +87,26 @@ def test_rule_fit_validates_inputs_and_returns_self() -> None:
     assert fitted is rule
 
 
+def test_rule_fit_documents_validates_labels() -> None:
+    """Document fitting should check label alignment and label types."""
+    rule = SlopWordRule(
+        SlopWordRuleConfig(
+            penalty=DEFAULT_HYPERPARAMETERS.slop_word_penalty,
+            context_window_chars=DEFAULT_HYPERPARAMETERS.context_window_chars,
+        )
+    )
+    documents = [AnalysisDocument.from_text("sample")]
+
+    with pytest.raises(ValueError):
+        rule.fit_documents(documents, [1, 0])
+
+    invalid_labels = cast(Any, ["positive"])
+    with pytest.raises(TypeError):
+        rule.fit_documents(documents, invalid_labels)
+
+    assert rule.fit_documents(documents, [1]) is rule
+
+
 def test_rule_to_dict_from_dict_round_trip() -> None:
     """Rules should round-trip config through base serialization helpers."""
     rule = SlopWordRule(